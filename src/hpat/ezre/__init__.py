@@ -5,10 +5,12 @@ from __future__ import annotations
 
 
 from typing import *
+import os
 import re
 from weakref import WeakValueDictionary
-from reprlib import recursive_repr
 import operator
+import itertools
+import collections
 import unittest
 import doctest
 import functools
@@ -40,6 +42,69 @@ def load_tests(loader, tests, ignore):
     return tests
 
 
+#: Precomputed strings for the common cardinality shapes,
+#: keyed on the normalized (start, stop, step).
+_FIXED = {
+    (1, 1, max): "",
+    (1, oo, max): "+",
+    (0, oo, max): "*",
+    (0, 1, max): "?",
+    (1, oo, min): "+?",
+    (0, oo, min): "*?",
+    (0, 1, min): "??",
+}
+
+
+#: Translation table covering the characters `re.escape` escapes.
+_ESCAPE_MAP = {ord(c): "\\" + c for c in "()[]{}?*+-|^$\\.&~# \t\n\r\v\f"}
+
+
+def _fast_escape(item: str) -> str:
+    """
+    Single-pass equivalent of `re.escape` for ASCII strings.
+
+    Caution
+    -------
+    Internal usage.
+    """
+    if item.isascii():
+        return item.translate(_ESCAPE_MAP)
+    else:
+        return re.escape(item)
+
+
+def _compile_cache_size(default: int=2048) -> int:
+    """
+    Size of the shared compile cache, read from the
+    `EZRE_COMPILE_CACHE` environment variable.
+
+    Falls back to `default` when the variable is unset or malformed.
+
+    Caution
+    -------
+    Internal usage.
+    """
+    try:
+        return int(os.environ.get("EZRE_COMPILE_CACHE", default))
+    except ValueError:
+        return default
+
+
+@functools.lru_cache(maxsize=_compile_cache_size())
+def _compile_cached(pattern: str) -> re.Pattern:
+    """
+    Memoized `re.compile`, shared by all instances.
+
+    The cache holds 2048 patterns by default;  the size can be tuned
+    through the `EZRE_COMPILE_CACHE` environment variable.
+
+    Caution
+    -------
+    Internal usage.  See also `Ezre.compile_cache_clear`.
+    """
+    return re.compile(pattern)
+
+
 class Cardinality:
     """
     Cardinality of a regular expression. 
@@ -123,19 +188,26 @@ class Cardinality:
     ...
     ValueError: step=<built-in function min> cannot be used when start=5 == stop=5
     """
+    __slots__ = ("_str", "_repr", "start", "stop", "step")
+
+    #: Canonical instances, keyed on the normalized (start, stop, step).
+    _interned: Dict[Tuple, Cardinality] = {}
+
     start: int
     stop: CompleteIN
     step: MinMax
 
     @overload
-    def __init__(self, stop: int | None):
+    def __new__(cls, stop: int | None):
         ...
 
     @overload
-    def __init__(self, start: int | None, stop: CompleteIN | None, step: MinMax | None=None):
+    def __new__(cls, start: int | None, stop: CompleteIN | None, step: MinMax | None=None):
         ...
 
-    def __init__(self, *slice_args):
+    def __new__(
+            cls, *slice_args,
+            _slice=slice, _int=int, _oo=oo, _min=min, _max=max):
         """
         Parameters
         ----------
@@ -162,68 +234,75 @@ class Cardinality:
             - If parameters are of invalid types. 
             - When `start` and `stop` are equal (not None values) and `step` is `min`. 
         """
-        slice_ = slice(*slice_args)
+        slice_ = _slice(*slice_args)
         start, stop, step = slice_.start, slice_.stop, slice_.step
         # typing:
-        start: int = 0 if start is None else int(start)
-        stop: CompleteIN = +oo if stop is None else int(stop)
-        step: MinMax = max if step is None else step
+        start: int = 0 if start is None else _int(start)
+        stop: CompleteIN = _oo if stop is None else _int(stop)
+        step: MinMax = _max if step is None else step
         # conditions:
-        if step not in (min, max):
+        if step not in (_min, _max):
             raise IndexError(f"{step=} not in {MinMax}")
         elif not 0 <= start <= stop:
             raise IndexError(f"0 <= {start=} <= {stop=} must hold")
-        elif start == stop and step is min:
+        elif start == stop and step is _min:
             raise ValueError(f"{step=} cannot be used when {start=} == {stop=}")
-        # actual work:
-        elif start == 0:
-            if stop == 1:
-                str_ = "?"
-            elif stop is +oo:
-                str_ = "*"
-            else:
-                str_ = rf"{{,{stop}}}"
-        elif start == 1:
-            if stop == 1:
-                str_ = str()
-            elif stop is +oo:
-                str_ = "+"
+        # interning, making repeated shapes a single dict lookup:
+        key = (start, stop, step)
+        if cls is Cardinality:
+            self = cls._interned.get(key)
+            if self is not None:
+                return self
+        # actual work, short-circuiting the common shapes:
+        str_ = _FIXED.get(key)
+        if str_ is None:
+            if start == 0:
+                if stop == 1:
+                    str_ = "?"
+                elif stop is _oo:
+                    str_ = "*"
+                else:
+                    str_ = rf"{{,{stop}}}"
+            elif start == 1:
+                if stop == 1:
+                    str_ = str()
+                elif stop is _oo:
+                    str_ = "+"
+                else:
+                    str_ = rf"{{{start},{stop}}}"
             else:
-                str_ = rf"{{{start},{stop}}}"
-        else:
-            if start == stop:
-                str_ = rf"{{{start}}}"
-            elif stop is +oo:
-                str_ = rf"{{{start},}}"
-            else:
-               str_ = rf"{{{start},{stop}}}"
-        # non-greedy option:
-        if start != stop and step is min:
-            str_ += "?"
+                if start == stop:
+                    str_ = rf"{{{start}}}"
+                elif stop is _oo:
+                    str_ = rf"{{{start},}}"
+                else:
+                    str_ = rf"{{{start},{stop}}}"
+            # non-greedy option:
+            if start != stop and step is _min:
+                str_ += "?"
         # end of work:
+        self = super().__new__(cls)
         self._str = str_
+        # instances are frozen, cache the representation:
+        self._repr = f"{cls.__name__}({start=}, {stop=}, {step=})"
         self.start: int = start
         self.stop: CompleteIN = stop
         self.step: MinMax = step
+        if cls is Cardinality:
+            cls._interned[key] = self
+        return self
 
     def __str__(self):
         return self._str
 
     def __repr__(self):
-        start, stop, step = self.start, self.stop, self.step
-        return (
-            f"{self.__class__.__name__}"
-            "("
-            f"{start=}"
-            ", "
-            f"{stop=}"
-            ", "
-            f"{step=}"
-            ")"
-        )
+        return self._repr
 
     def __eq__(self, other):
-        if not isinstance(other, self.__class__):
+        if self is other:
+            # the common case, thanks to interning:
+            return True
+        elif not isinstance(other, self.__class__):
             return False
         else:
             return str(self) == str(other)
@@ -237,17 +316,38 @@ class CARDINALITY:
     Maybe = Cardinality(1)
 
 
+#: Slice shortcuts resolved without any Cardinality construction.
+_SLICE_CARD = {
+    (None, None): CARDINALITY.Any,
+    (0, None): CARDINALITY.Any,
+    (1, None): CARDINALITY.Many,
+    (None, 1): CARDINALITY.Maybe,
+    (0, 1): CARDINALITY.Maybe,
+}
+
+
 class Var(str):
     """
-    String represented without quotes. 
+    String represented without quotes.
 
     Caution
     -------
-    Internal usage. 
+    Internal usage.
     """
     __repr__ = str.__str__
 
 
+class Alternation(str):
+    """
+    Bare alternation string, needing a group
+    in tighter-binding contexts.
+
+    Caution
+    -------
+    Internal usage.
+    """
+
+
 class Label:
     """
     Label of a regular expression. 
@@ -283,33 +383,41 @@ class Label:
 
 
     """
+    __slots__ = ("_expr",)
+
     class And:
+        __slots__ = ("_items", "_repr")
+
         def __init__(self, *items: Label):
             self._items: Sequence[Label] = tuple(items)
+            # labels are immutable, cache the representation:
+            self._repr = "".join(map(repr, self._items))
 
         @property
         def items(self):
             return self._items
 
-        @recursive_repr()
         def __repr__(self):
-            return "".join(map(repr, self._items))
+            return self._repr
 
     class Or:
+        __slots__ = ("_items", "_repr")
+
         def __init__(self, *items: Label):
             self._items: Sequence[Label] = tuple(items)
+            # labels are immutable, cache the representation:
+            free = "|".join(map(repr, self._items))
+            if len(self._items) > 1:
+                self._repr = f"({free})"
+            else:
+                self._repr = free
 
         @property
         def items(self):
             return self._items
 
-        @recursive_repr()
         def __repr__(self):
-            free = "|".join(map(repr, self._items))
-            if len(self._items) > 1:
-                return f"({free})"
-            else:
-                return free
+            return self._repr
 
     def __init__(self, expr: Any | And | Or):
         self._expr = expr
@@ -326,11 +434,22 @@ class Label:
         else:
             return self.__class__(self.Or(self, other))
 
-    @recursive_repr()
     def __repr__(self):
         return repr(self._expr)
 
 
+@functools.lru_cache(maxsize=1024)
+def _cardinality_label(cardinality: str) -> Label:
+    """
+    Shared label for a given cardinality string.
+
+    Caution
+    -------
+    Internal usage.
+    """
+    return Label(Var(cardinality))
+
+
 class Ezre:
     """
     Helper for the definition of regular expressions. 
@@ -352,7 +471,7 @@ class Ezre:
     >>> expr
     ax
     >>> expr.re
-    '(A|B)(X|Y)'
+    '(?:A|B)(?:X|Y)'
 
     # union:
 
@@ -360,7 +479,12 @@ class Ezre:
     >>> expr
     (a|x)
     >>> expr.re
-    '((A|B)|(X|Y))'
+    'A|B|X|Y'
+
+    # nested unions are flattened:
+
+    >>> (a | x | a).re
+    'A|B|X|Y|A|B'
 
     # precedence:
 
@@ -368,12 +492,12 @@ class Ezre:
     >>> expr
     (ax|x)
     >>> expr.re
-    '((A|B)(X|Y)|(X|Y))'
+    '(?:A|B)(?:X|Y)|X|Y'
     >>> expr = a + (x | x)
     >>> expr
     a(x|x)
     >>> expr.re
-    '(A|B)((X|Y)|(X|Y))'
+    '(?:A|B)(?:X|Y|X|Y)'
 
     # cardinality:
 
@@ -399,7 +523,12 @@ class Ezre:
     # sequence ordering:
 
     >>> Ezre.from_sequence(["c", "a", "ab"]).re
-    '(ab|a|c)'
+    'ab|a|c'
+
+    # unlabeled instances with equal patterns are shared:
+
+    >>> Ezre.from_str("[abc]") is Ezre.from_str("[abc]")
+    True
 
     # use case, with special characters:
 
@@ -408,36 +537,79 @@ class Ezre:
     >>> in_ = "fweM*o ta?i r\\\\oUz1z"
     >>> out_ = re.sub(XSAMPA, lambda m: XSAMPA_TO_IPA[m.group(0)], in_)
     >>> XSAMPA
-    '(M\\\\*|r\\\\\\\\|\\\\?|1|U)'
+    'M\\\\*|r\\\\\\\\|\\\\?|1|U'
     >>> out_
     'fweɰo taʔi ɹoʊzɨz'
 
+    # same use case, with the substitution helper:
+
+    >>> xsampa = Ezre.from_mapping(XSAMPA_TO_IPA)
+    >>> xsampa.substitute(in_)
+    'fweɰo taʔi ɹoʊzɨz'
+
+    # single-character mappings go through str.translate:
+
+    >>> accents = Ezre.from_mapping({"e": "é", "a": "à"})
+    >>> accents.substitute("banane")
+    'bànàné'
+
     # groups:
 
     >>> a.group("hello").re
-    '(?P<hello>(A|B))'
+    '(?P<hello>(?:A|B))'
     >>> Ezre.backref("hello").re
     '(?P=hello)'
 
     # lookaround assertions:
 
     >>> a.ahead().re  # positive lookahead
-    '(?=(A|B))'
+    '(?=(?:A|B))'
     >>> a.not_ahead().re  # negative lookahead
-    '(?!(A|B))'
+    '(?!(?:A|B))'
 
     >>> a.behind().re # positive lookbehind
-    '(?<=(A|B))'
+    '(?<=(?:A|B))'
     >>> a.not_behind().re # negative lookbehind
-    '(?<!(A|B))'
+    '(?<!(?:A|B))'
     """
-    _instances = WeakValueDictionary()
+    __slots__ = (
+        "_id", "_label", "_label_pending", "_label_str", "_expr",
+        "_cardinality", "_re", "_needs_group", "_compiled",
+        "_substitution", "_substitution_table", "_already_built",
+        "__weakref__")
+
+    #: Canonical unlabeled instances, keyed on their pattern string.
+    _interned = WeakValueDictionary()
+
+    #: Source of unique instance ids, used for the default labels.
+    _id_counter = itertools.count()
+    #: Kept for external consumers;  construction reads `_re` directly.
     get_re: Callable[[], str] = operator.attrgetter("re")
+    #: Drop the shared `re.compile` cache, e.g. between tests.
+    #: Patterns already cached on instances are kept.
+    compile_cache_clear = staticmethod(_compile_cached.cache_clear)
 
     class And:
-        def __init__(self, *items: Ezre):
-            self._items: Sequence[Ezre] = tuple(items)
-            self._re = r"".join(map(Ezre.get_re, self._items))
+        __slots__ = ("_items", "_re", "_needs_group")
+
+        def __init__(
+                self, *items: Ezre,
+                _isinstance=isinstance, _one=CARDINALITY.One):
+            # flatten nested concatenations (associative):
+            flat = []
+            for item in items:
+                if (_isinstance(item._expr, Ezre.And)
+                        and item._cardinality == _one):
+                    flat.extend(item._expr._items)
+                else:
+                    flat.append(item)
+            self._items: Sequence[Ezre] = tuple(flat)
+            # direct reads of the cached strings, no re-traversal;
+            # concatenation binds tighter than a bare alternation:
+            self._re = r"".join([
+                rf"(?:{item._re})" if item._needs_group else item._re
+                for item in self._items])
+            self._needs_group = False
 
         @property
         def items(self):
@@ -448,15 +620,26 @@ class Ezre:
             return self._re
 
     class Or:
-        def __init__(self, *items: Ezre):
-            self._items: Sequence[Ezre] = tuple(items)
-            # re attribute:
-            re_ = r"|".join(map(Ezre.get_re, self._items))
-            if len(self._items) > 1:
-                re_ = rf"({re_})"
-            else:
-                pass  # nothing to do
-            self._re = re_
+        __slots__ = ("_items", "_re", "_needs_group")
+
+        def __init__(
+                self, *items: Ezre,
+                _isinstance=isinstance, _one=CARDINALITY.One):
+            # flatten nested unions (associative):
+            flat = []
+            for item in items:
+                if (_isinstance(item._expr, Ezre.Or)
+                        and item._cardinality == _one):
+                    flat.extend(item._expr._items)
+                else:
+                    flat.append(item)
+            self._items: Sequence[Ezre] = tuple(flat)
+            # re attribute, kept bare:  nothing binds tighter here,
+            # and parents add a group only when they need one:
+            self._re = r"|".join([item._re for item in self._items])
+            self._needs_group = (
+                len(self._items) > 1
+                or any(item._needs_group for item in self._items))
 
         @property
         def items(self):
@@ -466,28 +649,80 @@ class Ezre:
         def re(self) -> re.Pattern:
             return self._re
 
+    def __new__(
+            cls,
+            expr: And | Or | str,
+            *,
+            label: str | Label | None=None,
+            cardinality: Cardinality | None=None,
+            _intern: bool=True):
+        # flyweight lookup, for unlabeled expressions only
+        # (labels are free-form, so labeled instances stay distinct):
+        if _intern and cls is Ezre and label is None and cardinality is None:
+            if isinstance(expr, str):
+                key = (expr, isinstance(expr, Alternation))
+            else:
+                key = (expr._re, expr._needs_group)
+            self = cls._interned.get(key)
+            if self is not None:
+                return self
+        self = super().__new__(cls)
+        self._already_built = False
+        return self
+
     def __init__(
             self,
             expr: And | Or | str,
             *,
             label: str | Label | None=None,
-            cardinality: Cardinality | None=None):
-        # keep weakref:
-        self._id = len(self._instances)
-        self._instances[self._id] = self
+            cardinality: Cardinality | None=None,
+            _intern: bool=True,
+            _isinstance=isinstance, _one=CARDINALITY.One):
+        if self._already_built:
+            return  # interned instance, nothing to do
+        # eligibility for the flyweight registry, mirroring __new__:
+        intern_ = (
+            _intern and type(self) is Ezre
+            and label is None and cardinality is None)
+        self._id = next(self._id_counter)
         # typing:
-        label: str | Label = label or f"#{self._id}"
-        self.as_(label)
+        if label is None:
+            # default label, built lazily on first access:
+            self._label = None
+            self._label_pending = None
+            self._label_str = None
+        else:
+            self._set_label(label)
         # actual work:
         self._expr: And | Or | str = expr
-        self._cardinality: Cardinality = cardinality or CARDINALITY.One
+        cardinality = cardinality or _one
+        self._cardinality: Cardinality = cardinality
         # re attribute:
-        if isinstance(self._expr, str):
-            re_ = self._expr + str(self._cardinality)
+        if _isinstance(expr, str):
+            re_ = expr
+            needs_group = _isinstance(expr, Alternation)
         else:
-            # recursivity:
-            re_ = self.get_re(self._expr) + str(self._cardinality)
+            # recursivity, from the string cached at construction:
+            re_ = expr._re
+            needs_group = expr._needs_group
+        # skip concatenation for the common implicit cardinality:
+        suffix = cardinality._str
+        if suffix:
+            if needs_group or (
+                    _isinstance(expr, self.And) and len(expr._items) > 1):
+                # the repetition must bind the whole expression:
+                re_ = rf"(?:{re_})"
+            re_ = re_ + suffix
+            needs_group = False
         self._re = re_
+        self._needs_group = needs_group
+        self._compiled: re.Pattern | None = None
+        self._substitution: Callable[[re.Match], str] | None = None
+        self._substitution_table: Mapping[int, str] | None = None
+        self._already_built = True
+        # register the canonical instance, keyed as in __new__:
+        if intern_:
+            self._interned[(self._re, self._needs_group)] = self
 
     @staticmethod
     def string_key(item: str) -> Tuple[int, str]:
@@ -507,17 +742,82 @@ class Ezre:
 
         Implementation
         --------------
-        Input strings in `expr` are escaped with `re.escape`. 
+        Input strings in `expr` are escaped with `re.escape`.
+        The alternation string is built in a single pass,
+        without intermediate instances for the alternatives.
         """
-        expr: Or = cls.Or(
-            *map(cls.from_str, sorted(set(map(re.escape, expr)), key=cls.string_key)))
-        return cls(expr=expr, *args, **kwargs)
+        escaped = list(map(_fast_escape, set(expr)))
+        if len(escaped) > 256:
+            # radix-style pass:  the primary key is the (bounded) length,
+            # so bucketing beats one big comparison sort:
+            buckets = collections.defaultdict(list)
+            for item in escaped:
+                buckets[len(item)].append(item)
+            escaped = [
+                item
+                for length in sorted(buckets, reverse=True)
+                for item in sorted(buckets[length])]
+        else:
+            escaped.sort(key=cls.string_key)
+        re_ = r"|".join(escaped)
+        if len(escaped) > 1:
+            # kept bare;  parents add a group only when they need one:
+            re_ = Alternation(re_)
+        else:
+            pass  # nothing to do
+        return cls(expr=re_, *args, **kwargs)
 
     @classmethod
     def from_str(cls, expr: str, *args, **kwargs) -> Ezre:
         """Build an instance from a string. """
         return cls(expr=expr, *args, **kwargs)
 
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, str], *args, **kwargs) -> Ezre:
+        """
+        Build an instance matching the keys of `mapping`,
+        remembering the values for use by `substitute`.
+
+        See Also
+        --------
+        from_sequence:  for the treatment of the keys.
+        substitute
+        """
+        # opt out of interning:  this instance carries the mapping state
+        # and must not be shared with other vocabularies:
+        self = cls.from_sequence(mapping, *args, _intern=False, **kwargs)
+        # prebuilt callback, reused across substitutions:
+        getter = mapping.__getitem__
+        self._substitution = lambda match: getter(match.group(0))
+        if all(len(key) == 1 for key in mapping):
+            # single-character vocabulary:
+            # substitution becomes one pass of str.translate:
+            self._substitution_table = str.maketrans(dict(mapping))
+        else:
+            pass  # nothing to do
+        return self
+
+    def substitute(self, text: str) -> str:
+        """
+        Replace every match in `text` by its value
+        in the mapping given to `from_mapping`.
+
+        Raises
+        ------
+        ValueError
+            If this instance was not built by `from_mapping`.
+
+        See Also
+        --------
+        Ezre:  for documentation on usage.
+        """
+        if self._substitution is None:
+            raise ValueError(f"{self!r} was not built by from_mapping")
+        elif self._substitution_table is not None:
+            return text.translate(self._substitution_table)
+        else:
+            return self.compiled.sub(self._substitution, text)
+
     @property
     def expr(self) -> And | Or | str:
         return self._expr
@@ -528,14 +828,30 @@ class Ezre:
 
     @property
     def compiled(self) -> re.Pattern:
-        return re.compile(self._re)
+        if self._compiled is None:
+            self._compiled = _compile_cached(self._re)
+        return self._compiled
 
     @property
     def label(self) -> Label:
+        if self._label is None:
+            pending = self._label_pending
+            if pending is None:
+                self._label = Label(Var(f"#{self._id}"))
+            else:
+                op, left, right = pending
+                self._label = op(left.label, right.label)
+                self._label_pending = None
         return self._label
 
-    def as_(self, label: str | Label) -> Ezre:
-        """Return a copy of this instance with the desired `label`. """
+    def _set_label(self, label: str | Label) -> None:
+        """
+        Assign `label` to this instance.
+
+        Caution
+        -------
+        Internal usage:  mutates `self`, see `as_`.
+        """
         if isinstance(label, str):
             # use Var to remove quotes in string representation:
             self._label = Label(Var(label))
@@ -543,7 +859,19 @@ class Ezre:
             self._label = label
         else:
             raise TypeError(f"{(type(label) == Union[str, Label])=}")
-        return self
+        self._label_pending = None
+        self._label_str = None
+
+    def as_(self, label: str | Label) -> Ezre:
+        """Return a copy of this instance with the desired `label`. """
+        # a true copy:  `self` may be a shared interned instance,
+        # which must not be relabeled under its other aliases:
+        result = self.__class__(
+            expr=self._expr, label=label, cardinality=self._cardinality)
+        # carry the substitution state of `from_mapping` instances:
+        result._substitution = self._substitution
+        result._substitution_table = self._substitution_table
+        return result
 
     def group(self, name: str) -> Ezre:
         """Return a copy of this instance with a regex group named `name`."""
@@ -569,7 +897,9 @@ class Ezre:
         return self._cardinality
 
     def __repr__(self):
-        return str(self._label)
+        if self._label_str is None:
+            self._label_str = str(self.label)
+        return self._label_str
 
     def __str__(self):
         return self._re
@@ -579,9 +909,12 @@ class Ezre:
         if not isinstance(other, self.__class__):
             return NotImplemented
         else:
-            return self.__class__(
-                expr=self.Or(self, other),
-                label=self.label | other.label)
+            result = self.__class__(expr=self.Or(self, other))
+            # label built lazily on first access;
+            # an interned instance keeps its first label:
+            if result._label is None and result._label_pending is None:
+                result._label_pending = (operator.or_, self, other)
+            return result
 
     def __add__(self, other) -> Ezre:
         """Concatenate instances"""
@@ -591,9 +924,12 @@ class Ezre:
         elif not isinstance(other, self.__class__):
             return NotImplemented
         # actual work:
-        return self.__class__(
-            expr=self.And(self, other),
-            label=self.label + other.label)
+        result = self.__class__(expr=self.And(self, other))
+        # label built lazily on first access;
+        # an interned instance keeps its first label:
+        if result._label is None and result._label_pending is None:
+            result._label_pending = (operator.add, self, other)
+        return result
 
     def __radd__(self, other) -> Ezre:
         if other is None:
@@ -610,12 +946,21 @@ class Ezre:
         --------
         Cardinality
         """
-        # typing:
+        # typing, with fast paths for the common shapes:
         if isinstance(cardinality, int):
-            cardinality = Cardinality(cardinality, cardinality)
+            if cardinality == 1:
+                return self
+            else:
+                cardinality = Cardinality(cardinality, cardinality)
         elif isinstance(cardinality, slice):
-            cardinality = Cardinality(
-                cardinality.start, cardinality.stop, cardinality.step)
+            shortcut = (
+                _SLICE_CARD.get((cardinality.start, cardinality.stop))
+                if cardinality.step is None else None)
+            if shortcut is not None:
+                cardinality = shortcut
+            else:
+                cardinality = Cardinality(
+                    cardinality.start, cardinality.stop, cardinality.step)
         elif isinstance(cardinality, Cardinality):
             pass  # nothing to do
         else:
@@ -626,7 +971,7 @@ class Ezre:
         else:
             return self.__class__(
                expr=self.expr,
-               label=self.label + Label(Var(cardinality)),
+               label=self.label + _cardinality_label(str(cardinality)),
                cardinality=cardinality)
 
     def ahead(self) -> Ezre: